@@ -1,8 +1,28 @@
-import scrapy
 import json
+import re
+from sys import intern
 
+from lxml import etree
 
-class AnimeCharacterSpider(scrapy.Spider):
+from base_spider import BaseSpider
+from html_stream import stream_elements
+from items import MyAnimeListCharacterItem
+
+
+# Character ID from /character/<id>/<name> links
+_CHAR_ID_RE = re.compile(r'/character/([^/?#]+)')
+
+# Row fields, compiled once and whitespace-normalized inside libxml2;
+# plain strings so rows can be freed after use
+_ROW_LINK = etree.XPath('string((.//td//a/@href)[1])', smart_strings=False)
+_ROW_NAME = etree.XPath('normalize-space((.//td//a/text())[1])', smart_strings=False)
+_ROW_ANIME = etree.XPath(
+    'normalize-space((.//td[count(preceding-sibling::*) = 1]//a/text())[1])', smart_strings=False)
+_ROW_ROLES = etree.XPath(
+    'normalize-space((.//td[count(preceding-sibling::*) = 2]/text())[1])', smart_strings=False)
+
+
+class AnimeCharacterSpider(BaseSpider):
     """
     MyAnimeList character database scraper
     Scrapes anime character profiles for character-building
@@ -16,8 +36,6 @@ class AnimeCharacterSpider(scrapy.Spider):
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 2,
         'COOKIES_ENABLED': True,
     }
 
@@ -25,41 +43,31 @@ class AnimeCharacterSpider(scrapy.Spider):
         super().__init__(*args, **kwargs)
         self.query = query
         self.pages = int(pages)
-        self.current_page = 1
-        # Search characters
-        self.start_urls = [
-            f'https://myanimelist.net/character.php?q={query}'
-        ]
+
+    def search_url(self, page):
+        """Character search results, 50 per page addressed by offset"""
+        return f'https://myanimelist.net/character.php?q={self.query}&show={(page - 1) * 50}'
 
     def parse(self, response):
         """Parse character search results from MyAnimeList"""
+        page = response.meta['page']
         
-        # Extract character rows
-        for row in response.css('tr'):
-            char_link = row.css('td a::attr(href)').get()
+        # Stream character rows as they are parsed instead of building the page DOM
+        for row in stream_elements(response.body, ('tr',), encoding=response.encoding):
+            char_link = _ROW_LINK(row)
             if not char_link or '/character/' not in char_link:
                 continue
             
-            char_id = char_link.split('/')[-2] if '/' in char_link else ''
+            match = _CHAR_ID_RE.search(char_link)
+            char_id = match.group(1) if match else ''
             
-            yield {
-                'id': char_id,
-                'name': row.css('td a::text').get('').strip(),
-                'url': response.urljoin(char_link),
-                'anime': row.css('td:nth-child(2) a::text').get('').strip(),
-                'roles': row.css('td:nth-child(3)::text').get('').strip(),
-                'query': self.query,
-                'source': 'myanimelist.net',
-                'page': self.current_page,
-            }
-
-        # Pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a[rel="next"]::attr(href)').get()
-            if next_page:
-                self.current_page += 1
-                yield scrapy.Request(
-                    response.urljoin(next_page),
-                    callback=self.parse,
-                    dont_obey_robotstxt=True,
-                )
+            yield MyAnimeListCharacterItem(
+                id=char_id,
+                name=_ROW_NAME(row),
+                url=response.urljoin(char_link),
+                anime=intern(_ROW_ANIME(row)),
+                roles=intern(_ROW_ROLES(row)),
+                query=self.query,
+                source='myanimelist.net',
+                page=page,
+            )
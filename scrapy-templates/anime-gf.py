@@ -1,7 +1,13 @@
+from sys import intern
+
 import scrapy
 
+from base_spider import BaseSpider
+from item_builders import build_anime_gf_item
+from selectolax_selector import FieldSet, SelectolaxSelector
+
 
-class AnimeGfSpider(scrapy.Spider):
+class AnimeGfSpider(BaseSpider):
     """
     anime.gf character scraper
     Scrapes anime girl/character profiles with detailed personality info
@@ -15,16 +21,51 @@ class AnimeGfSpider(scrapy.Spider):
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 2,
         'COOKIES_ENABLED': True,
+        # Characters repeat across listing pages; keep the dupe filter's memory flat
+        'DUPEFILTER_CLASS': 'bloom_dupefilter.BloomDupeFilter',
+        'BLOOMFILTER_BIT': 24,
+        'BLOOMFILTER_HASH_NUMBER': 6,
     }
 
+    # Card and detail fields, each gathered in a single subtree query
+    card_fields = FieldSet({
+        'link': ('a::attr(href)', '[data-url]::attr(data-url)'),
+        'name': ('h3::text', 'h4::text', 'span.name::text', 'a::text'),
+        'anime': ('p.anime-title::text', 'span.anime::text'),
+        'description': ('p.description::text', 'div.bio::text'),
+        'personality_type': ('span.personality::text', 'span.type::text'),
+        'traits': ('span.trait::text', 'span.tag::text'),
+        'image_url': ('img::attr(src)', 'img::attr(data-src)'),
+        'rating': ('span.rating::text', '[data-rating]::text'),
+        'popularity': ('span.popularity::text', '[data-popularity]::text'),
+    }, many=('traits',))
+
+    detail_fields = FieldSet({
+        'name': ('h1.title::text',),
+        'anime': ('a.anime-link::text',),
+        'description': ('div.bio-text::text',),
+        'personality': ('span.personality-type::text',),
+        'traits': ('span.character-trait::text',),
+        'personality_traits': ('div.personality-section span::text',),
+        'role': ('span.character-role::text',),
+        'age': ('span.age::text',),
+        'height': ('span.height::text',),
+        'hair_color': ('span.hair-color::text',),
+        'eye_color': ('span.eye-color::text',),
+        'voice_actor': ('span.voice-actor::text',),
+        'likes': ('div.likes ul li::text',),
+        'dislikes': ('div.dislikes ul li::text',),
+        'skills': ('div.skills ul li::text',),
+        'image_url': ('img.character-image::attr(src)',),
+        'rating': ('span.rating::text',),
+        'votes': ('span.votes::text',),
+    }, many=('traits', 'personality_traits', 'likes', 'dislikes', 'skills'))
+
     def __init__(self, category='popular', pages=5, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.category = category
         self.pages = int(pages)
-        self.current_page = 1
         
         # Build URL based on category
         if category == 'popular':
@@ -36,95 +77,73 @@ class AnimeGfSpider(scrapy.Spider):
 
     def parse(self, response):
         """Parse character listing pages"""
+        sel = SelectolaxSelector(response.text)
+        page = response.meta.get('page', 1)
         
         # Extract character cards - try multiple selector paths
-        for card in response.css('div.character-card, div.char-card, div[data-character], div.card, article, li'):
-            char_link = (card.css('a::attr(href)').get() or
-                        card.css('h3 a::attr(href)').get() or
-                        card.css('[data-url]::attr(data-url)').get())
-            
-            if not char_link or not char_link.startswith('/'):
+        for card in sel.css('div.character-card, div.char-card, div[data-character], div.card, article, li'):
+            char_data = build_anime_gf_item(
+                card.extract(self.card_fields), self.category, page, response.url)
+            if char_data is None:
                 continue
             
-            # Extract character ID from URL
-            char_id = char_link.split('/')[-1] if '/' in char_link else ''
-            
-            name = (card.css('h3::text').get() or
-                   card.css('h4::text').get() or
-                   card.css('span.name::text').get() or
-                   card.css('a::text').get(''))
-            
-            yield {
-                'id': char_id,
-                'name': name.strip() if name else '',
-                'anime': ((card.css('p.anime-title::text').get() or
-                          card.css('span.anime::text').get()) or '').strip(),
-                'description': ((card.css('p.description::text').get() or
-                                card.css('div.bio::text').get()) or '').strip(),
-                'personality_type': ((card.css('span.personality::text').get() or
-                                     card.css('span.type::text').get()) or '').strip(),
-                'traits': ','.join(card.css('span.trait, span.tag::text').getall()),
-                'image_url': (card.css('img::attr(src)').get() or
-                             card.css('img::attr(data-src)').get() or ''),
-                'rating': ((card.css('span.rating::text').get() or
-                           card.css('[data-rating]::text').get()) or '').strip(),
-                'popularity': ((card.css('span.popularity::text').get() or
-                               card.css('[data-popularity]::text').get()) or '').strip(),
-                'url': response.urljoin(char_link),
-                'category': self.category,
-                'source': 'anime.gf',
-                'page': self.current_page,
-            }
-            
-            # Follow to character detail page for more info
+            # Listing fields ride along to the detail page, which emits the single merged item
             yield scrapy.Request(
-                response.urljoin(char_link),
+                char_data['url'],
                 callback=self.parse_character_detail,
-                meta={'char_data': {
-                    'name': name.strip() if name else '',
-                    'category': self.category,
-                }},
-                dont_obey_robotstxt=True,
+                errback=self.detail_failed,
+                meta={'char_data': char_data, 'dont_obey_robotstxt': True},
+                priority=10,
             )
 
         # Pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a.next, a[rel="next"]::attr(href)').get()
+        if page < self.pages:
+            next_page = sel.css('a.next, a[rel="next"]::attr(href)').get()
             if next_page:
-                self.current_page += 1
                 yield scrapy.Request(
                     response.urljoin(next_page),
                     callback=self.parse,
-                    dont_obey_robotstxt=True,
+                    meta={'page': page + 1, 'dont_obey_robotstxt': True},
                 )
 
     def parse_character_detail(self, response):
         """Parse individual character detail page"""
+        sel = SelectolaxSelector(response.text)
         
         char_data = response.meta.get('char_data', {})
+        fields = sel.extract(self.detail_fields)
         
-        yield {
-            'id': response.url.split('/')[-1],
-            'name': response.css('h1.title::text').get('').strip() or char_data.get('name', ''),
-            'anime': response.css('a.anime-link::text').get('').strip(),
-            'description': response.css('div.bio-text::text').get('').strip(),
-            'personality': response.css('span.personality-type::text').get('').strip(),
-            'traits': ','.join(response.css('span.character-trait::text').getall()),
-            'personality_traits': ','.join(response.css('div.personality-section span::text').getall()),
-            'role': response.css('span.character-role::text').get('').strip(),
-            'age': response.css('span.age::text').get('').strip(),
-            'height': response.css('span.height::text').get('').strip(),
-            'hair_color': response.css('span.hair-color::text').get('').strip(),
-            'eye_color': response.css('span.eye-color::text').get('').strip(),
-            'voice_actor': response.css('span.voice-actor::text').get('').strip(),
-            'likes': ','.join(response.css('div.likes ul li::text').getall()),
-            'dislikes': ','.join(response.css('div.dislikes ul li::text').getall()),
-            'skills': ','.join(response.css('div.skills ul li::text').getall()),
-            'image_url': response.css('img.character-image::attr(src)').get(''),
-            'rating': response.css('span.rating::text').get('').strip(),
-            'votes': response.css('span.votes::text').get('').strip(),
+        detail = {
+            'id': response.url.rpartition('/')[2],
+            'name': fields['name'],
+            'anime': intern(fields['anime']),
+            'description': fields['description'],
+            'personality': intern(fields['personality']),
+            'traits': ','.join(fields['traits']),
+            'personality_traits': ','.join(fields['personality_traits']),
+            'role': intern(fields['role']),
+            'age': fields['age'],
+            'height': fields['height'],
+            'hair_color': intern(fields['hair_color']),
+            'eye_color': intern(fields['eye_color']),
+            'voice_actor': fields['voice_actor'],
+            'likes': ','.join(fields['likes']),
+            'dislikes': ','.join(fields['dislikes']),
+            'skills': ','.join(fields['skills']),
+            'image_url': fields['image_url'],
+            'rating': fields['rating'],
+            'votes': fields['votes'],
             'url': response.url,
             'category': char_data.get('category', 'popular'),
             'source': 'anime.gf',
             'detailed': True,
         }
+        
+        # Detail values win; listing values fill in whatever the detail page lacks
+        item = dict(char_data)
+        item.update((key, value) for key, value in detail.items() if value or key not in item)
+        yield item
+
+    def detail_failed(self, failure):
+        """Fall back to the listing item when the detail page can't be fetched"""
+        yield failure.request.meta['char_data']
@@ -1,7 +1,30 @@
-import scrapy
+import json
+from sys import intern
+from urllib.parse import urlencode
 
+from base_spider import BaseSpider
+from items import ArchiveOrgAudioItem
 
-class ArchiveOrgAudioSpider(scrapy.Spider):
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+_SEARCH_URL = 'https://archive.org/advancedsearch.php'
+_SEARCH_FIELDS = ('identifier', 'title', 'creator', 'date', 'description')
+_ROWS_PER_PAGE = 100
+
+
+def _text(value):
+    """advancedsearch returns repeated fields (creator, description) as lists"""
+    if isinstance(value, list):
+        return ', '.join(str(v).strip() for v in value)
+    return str(value).strip() if value is not None else ''
+
+
+class ArchiveOrgAudioSpider(BaseSpider):
     """
     Archive.org audio scraper
     Scrapes public domain and creative commons music
@@ -12,43 +35,38 @@ class ArchiveOrgAudioSpider(scrapy.Spider):
     """
     name = 'archive_org'
     allowed_domains = ['archive.org']
+    search_meta = {'dont_redirect': True}
 
     def __init__(self, genre='ambient', pages=3, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.genre = genre
         self.pages = int(pages)
-        self.current_page = 1
-        self.start_urls = [
-            f'https://archive.org/advancedsearch.php?q={genre}&mediatype=audio&rows=100'
-        ]
+
+    def search_url(self, page):
+        """JSON advancedsearch URL for one page of audio results"""
+        params = [('q', f'{self.genre} AND mediatype:audio')]
+        params += [('fl[]', field) for field in _SEARCH_FIELDS]
+        params += [('rows', _ROWS_PER_PAGE), ('page', page), ('output', 'json')]
+        return f'{_SEARCH_URL}?{urlencode(params)}'
 
     def parse(self, response):
         """Parse search results"""
+        page = response.meta['page']
+        result = _loads(response.body).get('response', {})
         
-        for item in response.css('div.results-item'):
-            identifier = item.css('div.identifier::text').get('')
-            if identifier:
-                identifier = identifier.strip()
-                
-            yield {
-                'title': item.css('div.title-text a::text').get('').strip(),
-                'identifier': identifier,
-                'creator': item.css('div.creator::text').get('').strip(),
-                'date': item.css('div.date::text').get('').strip(),
-                'description': item.css('div.description::text').get('').strip(),
-                'download_url': f'https://archive.org/download/{identifier}/' if identifier else '',
-                'genre': self.genre,
-                'source': 'archive.org',
-                'page': self.current_page,
-            }
-        
-        # Pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a.next::attr(href)').get()
-            if next_page:
-                self.current_page += 1
-                yield scrapy.Request(
-                    response.urljoin(next_page),
-                    callback=self.parse,
-                    meta={'dont_redirect': True}
-                )
+        for doc in result.get('docs', []):
+            identifier = _text(doc.get('identifier'))
+            if not identifier:
+                continue
+            
+            yield ArchiveOrgAudioItem(
+                title=_text(doc.get('title')),
+                identifier=identifier,
+                creator=intern(_text(doc.get('creator'))),
+                date=_text(doc.get('date')),
+                description=_text(doc.get('description')),
+                download_url=f'https://archive.org/download/{identifier}/',
+                genre=self.genre,
+                source='archive.org',
+                page=page,
+            )
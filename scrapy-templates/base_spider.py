@@ -0,0 +1,78 @@
+import scrapy
+
+
+# For spiders whose hosts haven't been checked for HTTP/2: Scrapy's H2
+# handler drops any connection that negotiates http/1.1 instead of falling
+# back, so these keep pooled HTTP/1.1 keep-alive connections
+HTTP11_DOWNLOAD_HANDLERS = {
+    'https': 'scrapy.core.downloader.handlers.http11.HTTP11DownloadHandler',
+}
+
+class BaseSpider(scrapy.Spider):
+    """
+    Shared base for the template spiders
+    Holds crawler-wide settings that every spider should run with
+
+    Settings here are applied underneath each spider's own
+    custom_settings, so a spider can still override any of them.
+
+    A spider whose result pages are addressable by number defines
+    search_url(page) and a `pages` count instead of start_urls; every page
+    is then queued up front with its number in meta['page']. Extra request
+    meta for those pages goes in search_meta.
+    """
+    search_meta = {}
+    base_settings = {
+        # Spread requests across domains when several spiders share a process
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        # Let AutoThrottle pace each domain from observed latency instead of
+        # a fixed DOWNLOAD_DELAY
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'AUTOTHROTTLE_START_DELAY': 1.0,
+        'AUTOTHROTTLE_MAX_DELAY': 10.0,
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        # Multiplex requests to a host over one HTTP/2 connection
+        'DOWNLOAD_HANDLERS': {
+            'https': 'scrapy.core.downloader.handlers.http2.H2DownloadHandler',
+        },
+        'TWISTED_REACTOR': 'twisted.internet.asyncioreactor.AsyncioSelectorReactor',
+        # Ask for compressed bodies; HttpCompressionMiddleware advertises
+        # gzip/deflate, plus br when brotli is installed
+        'COMPRESSION_ENABLED': True,
+        'DOWNLOAD_MAXSIZE': 10 * 1024 * 1024,
+        # Cache DNS lookups so reconnects to a host skip the resolver
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': 10000,
+        'DNS_TIMEOUT': 5,
+        # Threads for uncached DNS lookups, so new hosts don't queue behind each other
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        # Encode jsonlines feeds with msgspec
+        'FEED_EXPORTERS': {
+            'jsonlines': 'exporters.MsgspecJsonLinesItemExporter',
+        },
+    }
+
+    @classmethod
+    def update_settings(cls, settings):
+        settings.setdict(cls.base_settings, priority='spider')
+        super().update_settings(settings)
+
+    async def start(self):
+        # Scrapy 2.13+ only calls start(); older releases use start_requests()
+        for request in self.start_requests():
+            yield request
+
+    def start_requests(self):
+        search_url = getattr(self, 'search_url', None)
+        if search_url is None:
+            for url in self.start_urls:
+                yield scrapy.Request(url, dont_filter=True)
+            return
+        for page in range(1, self.pages + 1):
+            yield scrapy.Request(
+                search_url(page),
+                meta={**self.search_meta, 'page': page},
+                dont_filter=True,
+            )
@@ -0,0 +1,51 @@
+from scrapy.dupefilters import BaseDupeFilter
+
+
+class BloomDupeFilter(BaseDupeFilter):
+    """
+    Request dupe filter backed by an in-memory bloom filter
+    Drop-in replacement for RFPDupeFilter on long crawls
+
+    Stores a fixed bit array of 2**BLOOMFILTER_BIT bits instead of a set of
+    fingerprints, so memory stays flat no matter how many requests are seen.
+    False positives (a new URL reported as seen) are possible but rare when
+    the array is sized well above the expected request count.
+
+    Settings:
+        DUPEFILTER_CLASS = 'bloom_dupefilter.BloomDupeFilter'
+        BLOOMFILTER_BIT = 24            # 16M bits, 2 MB
+        BLOOMFILTER_HASH_NUMBER = 6
+    """
+
+    def __init__(self, bit=24, hash_number=6, fingerprinter=None):
+        self.mask = (1 << bit) - 1
+        self.hash_number = hash_number
+        self.bits = bytearray((1 << bit) // 8)
+        self.fingerprinter = fingerprinter
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        return cls(
+            bit=settings.getint('BLOOMFILTER_BIT', 24),
+            hash_number=settings.getint('BLOOMFILTER_HASH_NUMBER', 6),
+            fingerprinter=crawler.request_fingerprinter,
+        )
+
+    def request_seen(self, request):
+        # Fingerprints are already SHA1 digests; derive k positions by double hashing
+        fp = self.fingerprinter.fingerprint(request)
+        h1 = int.from_bytes(fp[:8], 'little')
+        h2 = int.from_bytes(fp[8:16], 'little') | 1
+
+        seen = True
+        for i in range(self.hash_number):
+            pos = (h1 + i * h2) & self.mask
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte] & bit:
+                seen = False
+                self.bits[byte] |= bit
+        return seen
+
+    def log(self, request, spider):
+        spider.crawler.stats.inc_value('dupefilter/filtered', spider=spider)
@@ -1,8 +1,12 @@
-import scrapy
 import json
 
+import scrapy
+
+from base_spider import BaseSpider
+from selectolax_selector import SelectolaxSelector
+
 
-class CharacterAiSpider(scrapy.Spider):
+class CharacterAiSpider(BaseSpider):
     """
     Character.ai-like character profile scraper
     Scrapes AI character profiles, descriptions, personalities
@@ -16,8 +20,6 @@ class CharacterAiSpider(scrapy.Spider):
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 2,
         'COOKIES_ENABLED': True,
     }
 
@@ -25,7 +27,6 @@ class CharacterAiSpider(scrapy.Spider):
         super().__init__(*args, **kwargs)
         self.category = category
         self.pages = int(pages)
-        self.current_page = 1
         # Browse by category
         self.start_urls = [
             f'https://character.ai/search?q={category}'
@@ -33,9 +34,11 @@ class CharacterAiSpider(scrapy.Spider):
 
     def parse(self, response):
         """Parse character search results"""
+        sel = SelectolaxSelector(response.text)
+        page = response.meta.get('page', 1)
         
         # Extract character cards - try multiple selectors
-        for card in response.css('div[data-character-id], div.character-card, div.card, article, li'):
+        for card in sel.css('div[data-character-id], div.character-card, div.card, article, li'):
             char_id = (card.css('::attr(data-character-id)').get() or
                       card.css('::attr(data-id)').get() or '')
             char_link = (card.css('a::attr(href)').get() or
@@ -51,31 +54,30 @@ class CharacterAiSpider(scrapy.Spider):
             
             yield {
                 'id': char_id or '',
-                'name': name.strip() if name else '',
-                'description': ((card.css('p.description::text').get() or
-                                card.css('div.bio::text').get()) or '').strip(),
+                'name': name or '',
+                'description': (card.css('p.description::text').get() or
+                               card.css('div.bio::text').get() or ''),
                 'category': self.category,
-                'author': ((card.css('span.author::text').get() or
-                           card.css('[data-author]::text').get()) or '').strip(),
-                'rating': ((card.css('span.rating::text').get() or
-                           card.css('[data-rating]::text').get()) or '').strip(),
-                'chat_count': ((card.css('span.chats::text').get() or
-                               card.css('[data-chats]::text').get()) or '').strip(),
+                'author': (card.css('span.author::text').get() or
+                          card.css('[data-author]::text').get() or ''),
+                'rating': (card.css('span.rating::text').get() or
+                          card.css('[data-rating]::text').get() or ''),
+                'chat_count': (card.css('span.chats::text').get() or
+                              card.css('[data-chats]::text').get() or ''),
                 'url': response.urljoin(char_link),
                 'avatar': (card.css('img::attr(src)').get() or
                           card.css('img::attr(data-src)').get() or ''),
-                'tags': ','.join(card.css('span.tag::text').getall()),
+                'tags': card.join('span.tag::text'),
                 'source': 'character.ai',
-                'page': self.current_page,
+                'page': page,
             }
 
         # Pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a.next::attr(href)').get()
+        if page < self.pages:
+            next_page = sel.css('a.next::attr(href)').get()
             if next_page:
-                self.current_page += 1
                 yield scrapy.Request(
                     response.urljoin(next_page),
                     callback=self.parse,
-                    dont_obey_robotstxt=True,
+                    meta={'page': page + 1, 'dont_obey_robotstxt': True},
                 )
@@ -1,7 +1,12 @@
+from sys import intern
+
 import scrapy
 
+from base_spider import BaseSpider
+from selectolax_selector import SelectolaxSelector
+
 
-class CharacterPersonalityDatabaseSpider(scrapy.Spider):
+class CharacterPersonalityDatabaseSpider(BaseSpider):
     """
     CharacterDB character personality scraper
     Scrapes character personality profiles and traits
@@ -15,15 +20,12 @@ class CharacterPersonalityDatabaseSpider(scrapy.Spider):
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 2,
     }
 
     def __init__(self, category='fantasy', pages=5, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.category = category
         self.pages = int(pages)
-        self.current_page = 1
         # Browse characters
         self.start_urls = [
             f'https://character-stats-database.herokuapp.com/characters?category={category}'
@@ -31,14 +33,16 @@ class CharacterPersonalityDatabaseSpider(scrapy.Spider):
 
     def parse(self, response):
         """Parse character database"""
+        sel = SelectolaxSelector(response.text)
+        page = response.meta.get('page', 1)
         
         # Extract character entries - try multiple selectors
-        for char in response.css('div.character-entry, tr.character-row, div.character-card, article, li'):
+        for char in sel.css('div.character-entry, tr.character-row, div.character-card, article, li'):
             char_id = (char.css('::attr(data-id)').get() or
                       char.css('td:first-child::text').get() or '')
-            char_name = ((char.css('span.name, td.name::text').get() or
-                         char.css('h3::text').get() or
-                         char.css('h4::text').get()) or '').strip()
+            char_name = (char.css('span.name, td.name::text').get() or
+                        char.css('h3::text').get() or
+                        char.css('h4::text').get() or '')
             
             if not char_name:
                 continue
@@ -46,28 +50,27 @@ class CharacterPersonalityDatabaseSpider(scrapy.Spider):
             yield {
                 'id': char_id.strip() if char_id else '',
                 'name': char_name,
-                'description': ((char.css('p.description, td.description::text').get() or
-                                char.css('div.bio::text').get()) or '').strip(),
-                'personality': ((char.css('span.personality, td.personality::text').get() or
-                               char.css('[data-personality]::text').get()) or '').strip(),
-                'traits': ','.join(char.css('span.trait, td.traits::text, [data-traits]::text').getall()),
+                'description': (char.css('p.description, td.description::text').get() or
+                               char.css('div.bio::text').get() or ''),
+                'personality': intern(char.css('span.personality, td.personality::text').get() or
+                                    char.css('[data-personality]::text').get() or ''),
+                'traits': char.join('span.trait, td.traits::text, [data-traits]::text'),
                 'category': self.category,
-                'origin': ((char.css('span.origin, td.origin::text').get() or
-                           char.css('[data-origin]::text').get()) or '').strip(),
-                'role': ((char.css('span.role, td.role::text').get() or
-                         char.css('[data-role]::text').get()) or '').strip(),
+                'origin': intern(char.css('span.origin, td.origin::text').get() or
+                                char.css('[data-origin]::text').get() or ''),
+                'role': intern(char.css('span.role, td.role::text').get() or
+                              char.css('[data-role]::text').get() or ''),
                 'source': 'character-db',
                 'url': response.urljoin(char.css('a::attr(href)').get() or ''),
-                'page': self.current_page,
+                'page': page,
             }
 
         # Pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a.next, a[aria-label*="next"]::attr(href)').get()
+        if page < self.pages:
+            next_page = sel.css('a.next, a[aria-label*="next"]::attr(href)').get()
             if next_page:
-                self.current_page += 1
                 yield scrapy.Request(
                     response.urljoin(next_page),
                     callback=self.parse,
-                    dont_obey_robotstxt=True,
+                    meta={'page': page + 1, 'dont_obey_robotstxt': True},
                 )
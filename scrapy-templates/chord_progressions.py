@@ -0,0 +1,52 @@
+# Roman numeral (major or minor) to scale degree
+_NOTATION = {
+    'I': '1', 'i': '1',
+    'II': '2', 'ii': '2',
+    'III': '3', 'iii': '3',
+    'IV': '4', 'iv': '4',
+    'V': '5', 'v': '5',
+    'VI': '6', 'vi': '6',
+    'VII': '7', 'vii': '7',
+}
+
+
+def chords_to_notation(chords):
+    """Convert chord names to standard notation"""
+    # Roman numeral before any modifier: 'IV-7' -> 'IV'
+    return ' '.join(_NOTATION.get(chord.partition('-')[0], chord) for chord in chords)
+
+
+def detect_key(chords):
+    """Detect likely key from chord progression"""
+    # Simple heuristic based on first chord
+    if chords:
+        first = chords[0].lower()
+        if 'maj' in first or first.startswith('I'):
+            return 'Major'
+        elif 'min' in first or first.startswith('vi'):
+            return 'Minor'
+    return 'Unknown'
+
+
+def build_progression_item(trend):
+    """
+    Build a progression item from one Hooktheory trends entry
+    Returns None when the trend has no named chords
+
+    Shared by the hooktheory spider and scripts/fetch-hooktheory.py so both
+    emit the same items.
+    """
+    chord_list = [chord['chord'] for chord in trend.get('chords', []) if chord.get('chord')]
+    if not chord_list:
+        return None
+
+    return {
+        'progression': ' → '.join(chord_list),
+        'count': trend.get('count', 0),
+        'relative_count': trend.get('relativefitnessscore', 0),
+        'num_songs': trend.get('num_songs', 0),
+        'notation': chords_to_notation(chord_list),
+        'key': detect_key(chord_list),
+        'source': 'hooktheory.com',
+        'music_theory_data': True,
+    }
@@ -0,0 +1,46 @@
+import codecs
+from dataclasses import is_dataclass
+
+from scrapy.exporters import JsonLinesItemExporter
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class MsgspecJsonLinesItemExporter(JsonLinesItemExporter):
+    """
+    JSON lines feed exporter that encodes items with msgspec
+    Falls back to Scrapy's stdlib-json exporter when msgspec is missing
+
+    msgspec encodes dicts and dataclass items directly, without the
+    intermediate dict Scrapy builds for every item. Anything else, such as
+    scrapy.Item, still goes through Scrapy's encoder, as do items whose
+    output would differ from it: with FEED_EXPORT_ENCODING unset, non-ASCII
+    text is escaped, and msgspec only writes UTF-8.
+
+    Settings:
+        FEED_EXPORTERS = {'jsonlines': 'exporters.MsgspecJsonLinesItemExporter'}
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self.ensure_ascii = self._kwargs['ensure_ascii']
+        # Extra json options (sort_keys, default, ...) are Scrapy's to honor
+        native = (msgspec is not None and set(self._kwargs) == {'ensure_ascii'}
+                  and codecs.lookup(self.encoding or 'utf-8').name == 'utf-8')
+        self.msgspec_encoder = msgspec.json.Encoder() if native else None
+
+    def export_item(self, item):
+        # Per-field serializers and field selection still go through Scrapy
+        if (self.msgspec_encoder is None or self.fields_to_export is not None
+                or not (isinstance(item, dict) or is_dataclass(item))):
+            return super().export_item(item)
+        try:
+            data = self.msgspec_encoder.encode(item)
+        except TypeError:
+            return super().export_item(item)
+        if self.ensure_ascii and not data.isascii():
+            return super().export_item(item)
+        self.file.write(data + b'\n')
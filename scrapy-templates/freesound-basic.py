@@ -1,7 +1,15 @@
-import scrapy
+import re
+from sys import intern
 
+from base_spider import BaseSpider
+from selectolax_selector import FieldSet, SelectolaxSelector
 
-class FreesoundSpider(scrapy.Spider):
+
+# Last path segment, ignoring a trailing slash: /people/x/sounds/123/ -> 123
+_SOUND_ID_RE = re.compile(r'([^/]+)/?$')
+
+
+class FreesoundSpider(BaseSpider):
     """
     Freesound.org sample web scraper
     Scrapes public sound listings by tag/search
@@ -9,38 +17,58 @@ class FreesoundSpider(scrapy.Spider):
     Usage:
         scrapy crawl freesound -a query=ambient
         scrapy crawl freesound -a query=electronic -a pages=3
+        scrapy crawl freesound -a query=rain -a fields=id,name,url
     """
     name = 'freesound'
     allowed_domains = ['freesound.org']
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 3,
         'COOKIES_ENABLED': True,
+        # Keep responses on disk so reruns while tuning don't re-fetch
+        'HTTPCACHE_ENABLED': True,
     }
 
-    def __init__(self, query='ambient', pages=5, *args, **kwargs):
+    # Per-sound fields, compiled once and gathered in a single subtree query
+    sound_selectors = {
+        'link': ('a::attr(href)', 'h3 a::attr(href)', '[data-sound-url]::attr(data-sound-url)'),
+        'name': ('h3::text', 'a::text', 'span.title::text'),
+        'username': ('a.user::text', 'span.user::text', '[data-author]::text'),
+        'duration': ('span.duration::text', '[data-duration]::text'),
+        'license': ('span.license::text', '[data-license]::text'),
+        'downloads': ('span.num-downloads::text', '[data-downloads]::text'),
+        'tags': ('a.tag::text', 'span.tag::text'),
+    }
+    sound_fields = FieldSet(sound_selectors, many=('tags',))
+
+    def __init__(self, query='ambient', pages=5, fields='', *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.query = query
         self.pages = int(pages)
-        self.current_page = 1
-        # Search endpoint
-        self.start_urls = [
-            f'https://freesound.org/search/?q={query}&s=score'
-        ]
+        
+        # -a fields=... narrows the item; selectors for other fields never run.
+        # The link is always needed to tell real sounds from layout blocks.
+        self.wanted = frozenset(f.strip() for f in fields.split(',') if f.strip()) or None
+        if self.wanted is not None:
+            self.sound_fields = FieldSet(
+                {field: selectors for field, selectors in self.sound_selectors.items()
+                 if field in self.wanted or field == 'link'},
+                many=('tags',))
+
+    def search_url(self, page):
+        """Search endpoint, one results page per request"""
+        return f'https://freesound.org/search/?q={self.query}&s=score&page={page}'
 
     def parse(self, response):
         """Parse search results page"""
+        sel = SelectolaxSelector(response.text)
+        page = response.meta['page']
         
         # Extract sound entries - try multiple selectors
-        for sound in response.css('li.sample, div.sample, div[data-sound-id], article'):
-            # Get sound data - try different selector paths
-            sound_link = (sound.css('a::attr(href)').get() or 
-                         sound.css('h3 a::attr(href)').get() or
-                         sound.css('[data-sound-url]::attr(data-sound-url)').get())
-            
-            sound_id = (sound.css('::attr(data-sound-id)').get() or 
+        for sound in sel.css('li.sample, div.sample, div[data-sound-id], article'):
+            fields = sound.extract(self.sound_fields)
+            sound_link = fields['link']
+            sound_id = (sound.css('::attr(data-sound-id)').get() or
                        sound.css('::attr(data-id)').get() or '')
             
             if not sound_link and not sound_id:
@@ -49,44 +77,23 @@ class FreesoundSpider(scrapy.Spider):
             # Extract ID from URL if needed
             if sound_id:
                 sid = sound_id
-            elif sound_link:
-                try:
-                    sid = sound_link.split('/')[-2]
-                except (IndexError, ValueError):
-                    sid = sound_link.split('/')[-1]
             else:
-                continue
+                match = _SOUND_ID_RE.search(sound_link)
+                sid = match.group(1) if match else ''
             
-            name = (sound.css('h3::text').get() or 
-                   sound.css('a::text').get() or 
-                   sound.css('span.title::text').get(''))
-            
-            yield {
+            item = {
                 'id': sid,
-                'name': name.strip() if name else '',
+                'name': fields.get('name', ''),
                 'url': response.urljoin(sound_link) if sound_link else '',
-                'username': ((sound.css('a.user::text').get() or
-                            sound.css('span.user::text').get() or
-                            sound.css('[data-author]::text').get('')) or '').strip(),
-                'duration': ((sound.css('span.duration::text').get() or
-                            sound.css('[data-duration]::text').get('')) or '').strip(),
-                'license': ((sound.css('span.license::text').get() or
-                           sound.css('[data-license]::text').get('')) or '').strip(),
-                'downloads': ((sound.css('span.num-downloads::text').get() or
-                             sound.css('[data-downloads]::text').get('')) or '').strip(),
-                'tags': ','.join(sound.css('a.tag::text, span.tag::text').getall()),
+                'username': fields.get('username', ''),
+                'duration': fields.get('duration', ''),
+                'license': intern(fields.get('license', '')),
+                'downloads': fields.get('downloads', ''),
+                'tags': ','.join(fields.get('tags', ())),
                 'genre': self.query,
                 'source': 'freesound.org',
-                'page': self.current_page,
+                'page': page,
             }
-
-        # Follow pagination
-        if self.current_page < self.pages:
-            next_page = response.css('a[rel="next"]::attr(href)').get()
-            if next_page:
-                self.current_page += 1
-                yield scrapy.Request(
-                    response.urljoin(next_page),
-                    callback=self.parse,
-                    dont_obey_robotstxt=True,
-                )
+            if self.wanted is not None:
+                item = {key: value for key, value in item.items() if key in self.wanted}
+            yield item
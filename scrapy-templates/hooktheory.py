@@ -1,8 +1,16 @@
-import scrapy
 import json
 
+from base_spider import HTTP11_DOWNLOAD_HANDLERS, BaseSpider
+from chord_progressions import build_progression_item
 
-class HooktheorySpider(scrapy.Spider):
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+class HooktheorySpider(BaseSpider):
     """
     Hooktheory.com spider for chord progressions and music theory data
     Scrapes popular chord progressions to help AI music generation
@@ -13,6 +21,11 @@ class HooktheorySpider(scrapy.Spider):
     """
     name = 'hooktheory'
     allowed_domains = ['hooktheory.com']
+    custom_settings = {
+        'DOWNLOAD_HANDLERS': HTTP11_DOWNLOAD_HANDLERS,
+        # Only retry what a rate-limited API actually recovers from
+        'RETRY_HTTP_CODES': [429, 500, 502, 503, 504],
+    }
 
     def __init__(self, limit='100', *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -26,7 +39,7 @@ class HooktheorySpider(scrapy.Spider):
     def parse(self, response):
         """Parse trends endpoint"""
         try:
-            data = json.loads(response.text)
+            data = _loads(response.body)
         except json.JSONDecodeError:
             self.logger.error("Failed to parse JSON from API")
             return
@@ -39,55 +52,7 @@ class HooktheorySpider(scrapy.Spider):
             if self.processed_count >= self.limit:
                 break
 
-            # Extract chord progression
-            chords = trend.get('chords', [])
-            chord_list = []
-            
-            for chord in chords:
-                chord_name = chord.get('chord', '')
-                if chord_name:
-                    chord_list.append(chord_name)
-
-            if chord_list:
-                yield {
-                    'progression': ' → '.join(chord_list),
-                    'count': trend.get('count', 0),
-                    'relative_count': trend.get('relativefitnessscore', 0),
-                    'num_songs': trend.get('num_songs', 0),
-                    'notation': self._chords_to_notation(chord_list),
-                    'key': self._detect_key(chord_list),
-                    'source': 'hooktheory.com',
-                    'music_theory_data': True,
-                }
+            item = build_progression_item(trend)
+            if item is not None:
+                yield item
                 self.processed_count += 1
-
-    def _chords_to_notation(self, chords):
-        """Convert chord names to standard notation"""
-        notation_map = {
-            'I': '1', 'i': '1',
-            'II': '2', 'ii': '2',
-            'III': '3', 'iii': '3',
-            'IV': '4', 'iv': '4',
-            'V': '5', 'v': '5',
-            'VI': '6', 'vi': '6',
-            'VII': '7', 'vii': '7',
-        }
-        
-        result = []
-        for chord in chords:
-            # Extract roman numeral and modifiers
-            base = chord.split('-')[0] if '-' in chord else chord
-            result.append(notation_map.get(base, chord))
-        
-        return ' '.join(result)
-
-    def _detect_key(self, chords):
-        """Detect likely key from chord progression"""
-        # Simple heuristic based on first chord
-        if chords:
-            first = chords[0].lower()
-            if 'maj' in first or first.startswith('I'):
-                return 'Major'
-            elif 'min' in first or first.startswith('vi'):
-                return 'Minor'
-        return 'Unknown'
@@ -0,0 +1,38 @@
+from lxml import etree
+
+
+def stream_elements(body, tags, classes=None, encoding=None, chunk_size=64 * 1024):
+    """
+    Incrementally parse HTML and yield matching elements as they close
+    Lets a spider emit items while the page is still being tokenized
+
+    Once the caller moves on, each yielded element is cleared together
+    with the siblings before it, so memory stays bounded by the largest
+    element instead of the whole page. Elements nested inside another
+    match are kept until the outer one is released.
+
+    Usage:
+        for row in stream_elements(response.body, ('tr',)):
+            link = row.findtext('.//a')
+    """
+    tags = tuple(tags)
+    classes = set(classes) if classes else None
+    parser = etree.HTMLPullParser(events=('end',), tag=tags, encoding=encoding)
+
+    for offset in range(0, len(body), chunk_size):
+        parser.feed(body[offset:offset + chunk_size])
+        yield from _drain(parser, tags, classes)
+
+    parser.close()
+    yield from _drain(parser, tags, classes)
+
+
+def _drain(parser, tags, classes):
+    for _, element in parser.read_events():
+        if not classes or classes.intersection((element.get('class') or '').split()):
+            yield element
+
+        if next(element.iterancestors(*tags), None) is None:
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
@@ -0,0 +1,5 @@
+cimport cython
+
+
+@cython.locals(char_link=str, char_id=str)
+cpdef dict build_anime_gf_item(dict fields, str category, int page, str base_url)
@@ -0,0 +1,34 @@
+from sys import intern
+from urllib.parse import urljoin
+
+
+def build_anime_gf_item(fields, category, page, base_url):
+    """
+    Build an anime.gf listing item from a card's extracted FieldSet values
+    Returns None when the card has no relative character link
+
+    Plain Python by default; item_builders.pxd adds static types so the
+    module can be compiled in place with `cythonize -i -3 item_builders.py`.
+    """
+    char_link = fields['link']
+    if not char_link or not char_link.startswith('/'):
+        return None
+
+    # Extract character ID from URL
+    char_id = char_link.rpartition('/')[2]
+
+    return {
+        'id': char_id,
+        'name': fields['name'],
+        'anime': intern(fields['anime']),
+        'description': fields['description'],
+        'personality_type': intern(fields['personality_type']),
+        'traits': ','.join(fields['traits']),
+        'image_url': fields['image_url'],
+        'rating': fields['rating'],
+        'popularity': fields['popularity'],
+        'url': urljoin(base_url, char_link),
+        'category': category,
+        'source': 'anime.gf',
+        'page': page,
+    }
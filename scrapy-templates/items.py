@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+# Fixed-schema items for the high-volume spiders. Slotted dataclasses skip the
+# per-item hash table of a dict and are supported natively by Scrapy's
+# itemadapter, so pipelines and feed exporters handle them like dicts.
+
+
+@dataclass(slots=True)
+class MyAnimeListCharacterItem:
+    id: str
+    name: str
+    url: str
+    anime: str
+    roles: str
+    query: str
+    source: str
+    page: int
+
+
+@dataclass(slots=True)
+class ArchiveOrgAudioItem:
+    title: str
+    identifier: str
+    creator: str
+    date: str
+    description: str
+    download_url: str
+    genre: str
+    source: str
+    page: int
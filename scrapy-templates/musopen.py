@@ -1,7 +1,22 @@
 import scrapy
+from lxml import etree
 
+from base_spider import HTTP11_DOWNLOAD_HANDLERS, BaseSpider
+from xpath_helpers import has_class, xpath_row
 
-class MusopenSpider(scrapy.Spider):
+
+# Listing selectors, compiled once; each item's fields come from a single evaluation
+_ITEMS = etree.XPath(f'//div[{has_class("music-item")}]')
+_ITEM_ROW = xpath_row(
+    f'.//h3[{has_class("music-title")}]/text()',
+    f'.//span[{has_class("composer")}]/text()',
+    f'.//span[{has_class("duration")}]/text()',
+    f'.//a[{has_class("download")}]/@href',
+    '@data-id',
+)
+
+
+class MusopenSpider(BaseSpider):
     """
     Musopen.org spider for classical music samples
     Scrapes public domain classical music recordings
@@ -12,13 +27,15 @@ class MusopenSpider(scrapy.Spider):
     """
     name = 'musopen'
     allowed_domains = ['musopen.org']
+    custom_settings = {
+        'DOWNLOAD_HANDLERS': HTTP11_DOWNLOAD_HANDLERS,
+    }
 
     def __init__(self, composer='', category='classical', pages=3, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.composer = composer
         self.category = category
         self.pages = int(pages)
-        self.current_page = 1
         
         # Build search URL
         if composer:
@@ -32,14 +49,10 @@ class MusopenSpider(scrapy.Spider):
 
     def parse(self, response):
         """Parse music listings"""
+        page = response.meta.get('page', 1)
         
-        for item in response.css('div.music-item'):
-            title = item.css('h3.music-title::text').get('').strip()
-            composer = item.css('span.composer::text').get('').strip()
-            duration = item.css('span.duration::text').get('').strip()
-            
-            download_btn = item.css('a.download::attr(href)').get()
-            music_id = item.css('div.music-item::attr(data-id)').get('')
+        for item in _ITEMS(response.selector.root):
+            title, composer, duration, download_btn, music_id = _ITEM_ROW(item)
             
             if title and music_id:
                 yield {
@@ -50,18 +63,18 @@ class MusopenSpider(scrapy.Spider):
                     'download_url': response.urljoin(download_btn) if download_btn else '',
                     'category': self.category,
                     'format': self._get_format(download_btn),
-                    'page': self.current_page,
+                    'page': page,
                     'source': 'musopen.org',
                 }
         
         # Pagination
-        if self.current_page < self.pages:
+        if page < self.pages:
             next_page = response.css('a.next-page::attr(href)').get()
             if next_page:
-                self.current_page += 1
                 yield scrapy.Request(
                     response.urljoin(next_page),
-                    callback=self.parse
+                    callback=self.parse,
+                    meta={'page': page + 1},
                 )
 
     def _get_format(self, url):
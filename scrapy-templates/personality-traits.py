@@ -1,8 +1,45 @@
 import scrapy
 import json
+from lxml import etree
 
+from base_spider import HTTP11_DOWNLOAD_HANDLERS, BaseSpider
+from xpath_helpers import has_class, xpath_row
 
-class PersonalityTraitsSpider(scrapy.Spider):
+
+# Type card selectors, compiled once; the single-valued fields (and their
+# fallbacks) come from one evaluation per card
+_CARD_ROW = xpath_row(
+    '@data-type',
+    'descendant-or-self::*[@data-code]/text()',
+    './/h3/text()',
+    './/h4/text()',
+    f'.//span[{has_class("title")}]/text()',
+    './/p/text()',
+    f'.//div[{has_class("description")}]/text()',
+    './/a/@href',
+)
+_CARD_TRAITS = etree.XPath(
+    f'.//span[{has_class("trait")} or @data-trait]/text()', smart_strings=False)
+_CARD_STRENGTHS = etree.XPath(
+    f'.//ul[{has_class("strengths")}]//li/text() | .//*[@data-strengths]//li/text()',
+    smart_strings=False)
+_CARD_WEAKNESSES = etree.XPath(
+    f'.//ul[{has_class("weaknesses")}]//li/text() | .//*[@data-weaknesses]//li/text()',
+    smart_strings=False)
+
+# Detail page selectors, compiled once and evaluated against the page root
+_DETAIL_ROW = xpath_row('//h1/text()', f'//div[{has_class("description")}]/text()')
+_DETAIL_CHARACTERISTICS = etree.XPath(
+    f'//div[{has_class("characteristics")}]//li/text()', smart_strings=False)
+_DETAIL_FUNCTIONS = etree.XPath(
+    f'//div[{has_class("functions")}]//li/text()', smart_strings=False)
+_DETAIL_FAMOUS_PEOPLE = etree.XPath(
+    f'//div[{has_class("famous-people")}]//li/text()', smart_strings=False)
+_DETAIL_CAREERS = etree.XPath(
+    f'//div[{has_class("careers")}]//li/text()', smart_strings=False)
+
+
+class PersonalityTraitsSpider(BaseSpider):
     """
     Personality types and traits database scraper
     Scrapes MBTI types, personality traits, and descriptions
@@ -16,14 +53,14 @@ class PersonalityTraitsSpider(scrapy.Spider):
     custom_settings = {
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'ROBOTSTXT_OBEY': False,
-        'CONCURRENT_REQUESTS': 1,
-        'DOWNLOAD_DELAY': 2,
+        'DOWNLOAD_HANDLERS': HTTP11_DOWNLOAD_HANDLERS,
+        # Keep responses on disk so reruns while tuning don't re-fetch
+        'HTTPCACHE_ENABLED': True,
     }
 
     def __init__(self, pages=1, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pages = int(pages)
-        self.current_page = 1
         # 16 Personalities types
         self.start_urls = [
             'https://www.16personalities.com/personality-types'
@@ -31,56 +68,57 @@ class PersonalityTraitsSpider(scrapy.Spider):
 
     def parse(self, response):
         """Parse personality types from 16personalities"""
+        page = response.meta.get('page', 1)
         
         # Extract personality type cards - try multiple selectors
         for card in response.css('div.type-card, div.personality-type, div[data-type], div.card, article'):
-            type_code = (card.css('::attr(data-type)').get() or
-                        card.css('[data-code]::text').get() or '')
+            root = card.root
+            (data_type, data_code, h3, h4, title,
+             paragraph, description, link) = _CARD_ROW(root)
+            type_code = data_type or data_code
             
-            name = (card.css('h3::text').get() or
-                   card.css('h4::text').get() or
-                   card.css('span.title::text').get() or '')
+            name = h3 or h4 or title
             
             if not name:
                 continue
             
             yield {
                 'id': type_code or name[:4],
-                'name': name.strip() if name else '',
-                'code': type_code or '',
-                'description': ((card.css('p::text').get() or
-                                card.css('div.description::text').get()) or '').strip(),
-                'traits': ','.join(card.css('span.trait, span[data-trait]::text').getall()),
-                'strengths': ','.join(card.css('ul.strengths li::text, [data-strengths] li::text').getall()),
-                'weaknesses': ','.join(card.css('ul.weaknesses li::text, [data-weaknesses] li::text').getall()),
-                'url': response.urljoin(card.css('a::attr(href)').get() or ''),
+                'name': name,
+                'code': type_code,
+                'description': paragraph or description,
+                'traits': ','.join(_CARD_TRAITS(root)),
+                'strengths': ','.join(_CARD_STRENGTHS(root)),
+                'weaknesses': ','.join(_CARD_WEAKNESSES(root)),
+                'url': response.urljoin(link),
                 'category': 'mbti',
                 'source': '16personalities.com',
-                'page': self.current_page,
+                'page': page,
             }
         
         # Follow personality detail pages
-        if self.current_page < self.pages:
+        if page < self.pages:
             for detail_link in response.css('a.type-link::attr(href), a[data-type]::attr(href)').getall()[:3]:
                 yield scrapy.Request(
                     response.urljoin(detail_link),
                     callback=self.parse_personality_detail,
-                    dont_obey_robotstxt=True,
+                    meta={'dont_obey_robotstxt': True},
                 )
 
     def parse_personality_detail(self, response):
         """Parse detailed personality page"""
         
-        personality_type = response.css('h1::text').get('').strip()
+        root = response.selector.root
+        personality_type, description = _DETAIL_ROW(root)
         
         yield {
             'id': personality_type[:4],  # Extract code like INTJ
             'name': personality_type,
-            'description': response.css('div.description::text').get('').strip(),
-            'characteristics': ','.join(response.css('div.characteristics li::text').getall()),
-            'cognitive_functions': ','.join(response.css('div.functions li::text').getall()),
-            'famous_people': ','.join(response.css('div.famous-people li::text').getall()),
-            'career_matches': ','.join(response.css('div.careers li::text').getall()),
+            'description': description,
+            'characteristics': ','.join(_DETAIL_CHARACTERISTICS(root)),
+            'cognitive_functions': ','.join(_DETAIL_FUNCTIONS(root)),
+            'famous_people': ','.join(_DETAIL_FAMOUS_PEOPLE(root)),
+            'career_matches': ','.join(_DETAIL_CAREERS(root)),
             'url': response.url,
             'category': 'mbti_detailed',
             'source': '16personalities.com',
@@ -0,0 +1,239 @@
+import re
+from functools import lru_cache
+from itertools import chain
+
+from selectolax.lexbor import LexborHTMLParser
+
+
+# Trailing parsel pseudo-element on a single selector: ::text or ::attr(name)
+_PSEUDO_RE = re.compile(r'::(?:(text)|attr\(([^)]+)\))\s*$')
+
+# Compound selector understood by FieldSet: tag, .class and [attr] parts
+_COMPOUND_RE = re.compile(r'^([\w-]+|\*)?((?:\.[\w-]+)*)((?:\[[\w-]+\])*)$')
+
+# Nodes no spider selects from; dropped right after parsing so every later
+# query walks a smaller tree
+_NOISE_QUERY = 'script, style, svg, noscript, iframe, link[rel="preload"]'
+
+
+@lru_cache(maxsize=256)
+def _split_query(query):
+    """
+    Split a parsel-style CSS query into (css, pseudo, attr) parts
+    Cached so each literal query is only parsed once per process
+    """
+    parts = []
+    for part in query.split(','):
+        part = part.strip()
+        match = _PSEUDO_RE.search(part)
+        if not match:
+            parts.append((part, None, None))
+        elif match.group(1):
+            parts.append((part[:match.start()].strip(), 'text', None))
+        else:
+            parts.append((part[:match.start()].strip(), 'attr', match.group(2).strip()))
+
+    # One lexbor call keeps document order when all parts extract the same thing
+    if len(parts) > 1 and all(p[0] and p[1:] == parts[0][1:] for p in parts):
+        parts = [(', '.join(p[0] for p in parts),) + parts[0][1:]]
+    return tuple(parts)
+
+
+def _select(scope, query):
+    """
+    (node, pseudo, attr) for every part of query, each node reported once
+    lexbor yields a node again for each selector of a group it matches;
+    parsel's union doesn't, so repeats are dropped keeping document order
+    """
+    seen = set()
+    for css, pseudo, attr in _split_query(query):
+        for node in (scope.css(css) if css else (scope,)):
+            key = (node.mem_id, pseudo, attr)
+            if key not in seen:
+                seen.add(key)
+                yield node, pseudo, attr
+
+
+def _parse_compound(text):
+    match = _COMPOUND_RE.match(text)
+    if not match:
+        raise ValueError(f'Unsupported FieldSet selector: {text!r}')
+    tag = match.group(1) if match.group(1) != '*' else None
+    classes = frozenset(match.group(2).split('.')[1:])
+    attrs = tuple(re.findall(r'\[([\w-]+)\]', match.group(3)))
+    return tag, classes, attrs
+
+
+def _matches(node, compound):
+    tag, classes, attrs = compound
+    if tag and node.tag != tag:
+        return False
+    if classes or attrs:
+        attributes = node.attributes
+        if classes and not classes.issubset((attributes.get('class') or '').split()):
+            return False
+        if any(attr not in attributes for attr in attrs):
+            return False
+    return True
+
+
+def _has_ancestors(node, ancestors, scope):
+    """Match descendant combinators by walking up to (and including) scope"""
+    remaining = list(ancestors)
+    parent = node.parent
+    while remaining and parent is not None:
+        if _matches(parent, remaining[-1]):
+            remaining.pop()
+        if parent.mem_id == scope.mem_id:
+            break
+        parent = parent.parent
+    return not remaining
+
+
+def _extract(node, pseudo, attr):
+    """
+    Value of a ::text / ::attr() pseudo-element on node, None if missing
+    ::text is whitespace-normalized like XPath normalize-space(): ends are
+    trimmed and inner runs collapse to one space, so callers need no .strip()
+    """
+    if pseudo is None:
+        return node.html
+    if pseudo == 'text':
+        return ' '.join(node.text(deep=False).split()) or None
+    return node.attributes.get(attr)
+
+
+class FieldSet:
+    """
+    Precompiled group of fields pulled from a subtree in one lexbor query
+    Replaces a run of `card.css(a).get() or card.css(b).get()` lookups
+
+    Each field maps to alternatives in priority order; every alternative is
+    a descendant-combinator selector ending in ::text or ::attr(name). Fields
+    listed in `many` collect every match in document order instead.
+
+    Usage:
+        CARD = FieldSet({
+            'name': ('h3::text', 'span.name::text'),
+            'tags': ('span.tag::text',),
+        }, many=('tags',))
+        fields = card.extract(CARD)
+    """
+
+    def __init__(self, fields, many=()):
+        self.many = frozenset(many)
+        self.fields = tuple(fields)
+        self.by_tag = {}
+        queries = []
+        for field, alternatives in fields.items():
+            for rank, alternative in enumerate(alternatives):
+                (css, pseudo, attr), = _split_query(alternative)
+                compounds = tuple(_parse_compound(c) for c in css.split())
+                rule = (field, rank, compounds[:-1], compounds[-1], pseudo, attr)
+                self.by_tag.setdefault(compounds[-1][0], []).append(rule)
+                if css not in queries:
+                    queries.append(css)
+        self.query = ', '.join(queries)
+
+    def extract(self, scope):
+        values = {field: [] if field in self.many else '' for field in self.fields}
+        ranks = {}
+        wildcard = self.by_tag.get(None, [])
+        # lexbor reports a node once per selector in the group it matches
+        handled = set()
+        for node in scope.css(self.query):
+            if node.mem_id in handled:
+                continue
+            handled.add(node.mem_id)
+            seen = set()
+            for field, rank, ancestors, compound, pseudo, attr in chain(
+                    self.by_tag.get(node.tag, []), wildcard):
+                if field in seen or ranks.get(field, rank + 1) <= rank:
+                    continue
+                if not _matches(node, compound):
+                    continue
+                if ancestors and not _has_ancestors(node, ancestors, scope):
+                    continue
+                value = _extract(node, pseudo, attr)
+                if value is None:
+                    continue
+                seen.add(field)
+                if field in self.many:
+                    values[field].append(value)
+                else:
+                    values[field] = value
+                    ranks[field] = rank
+        return values
+
+
+class SelectolaxSelectorList(list):
+    """List of selector results with parsel's .get() / .getall()"""
+
+    def get(self, default=None):
+        if not self:
+            return default
+        first = self[0]
+        return first.get() if isinstance(first, SelectolaxSelector) else first
+
+    def getall(self):
+        return [item.get() if isinstance(item, SelectolaxSelector) else item
+                for item in self]
+
+
+class SelectolaxSelector:
+    """
+    Minimal parsel-compatible selector backed by selectolax/lexbor
+    Parses the page once with lexbor and answers .css() queries
+
+    Supports the subset of parsel used by the spiders: plain CSS,
+    trailing ::text and ::attr(name), and comma-separated selector groups.
+    Unlike parsel, ::text values come back whitespace-normalized, and script,
+    style, svg, noscript, iframe and preload links are removed from the
+    page before the first query (pass strip=False to keep them).
+
+    Usage:
+        sel = SelectolaxSelector(response.text)
+        for card in sel.css('div.card'):
+            name = card.css('h3::text').get('')
+    """
+    __slots__ = ('node',)
+
+    def __init__(self, text=None, node=None, strip=True):
+        if node is None:
+            node = LexborHTMLParser(text).root
+            if strip:
+                for noise in node.css(_NOISE_QUERY):
+                    noise.decompose()
+        self.node = node
+
+    def css(self, query):
+        results = SelectolaxSelectorList()
+        for node, pseudo, attr in _select(self.node, query):
+            if pseudo is None:
+                results.append(SelectolaxSelector(node=node))
+                continue
+            value = _extract(node, pseudo, attr)
+            if value is not None:
+                results.append(value)
+        return results
+
+    def join(self, query, sep=','):
+        """
+        Join every value matched by query into one string
+        Same result as sep.join(sel.css(query).getall()) without the
+        intermediate selector list
+        """
+        return sep.join(self._values(query))
+
+    def _values(self, query):
+        for node, pseudo, attr in _select(self.node, query):
+            value = _extract(node, pseudo, attr)
+            if value is not None:
+                yield value
+
+    def extract(self, fields):
+        """Pull every field of a precompiled FieldSet in one subtree query"""
+        return fields.extract(self.node)
+
+    def get(self):
+        return self.node.html
@@ -0,0 +1,37 @@
+from lxml import etree
+
+
+# Private-use code point joining the fields of a row; never present in page text
+_SEP = '\ue000'
+
+
+def has_class(name):
+    """
+    XPath test equivalent to the CSS .name class selector
+    Matches name as a whole token of @class, as parsel's translation does
+
+    Usage:
+        TITLE = etree.XPath(f'.//h3[{has_class("title")}]/text()')
+    """
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def xpath_row(*exprs):
+    """
+    Compile exprs into one XPath returning the first result of each
+    Pulls every field of a row in a single evaluation
+
+    Fields come back as a tuple of strings, whitespace-normalized by
+    libxml2, '' for a missing one.
+
+    Usage:
+        ROW = xpath_row('.//h3/text()', './/a/@href')
+        title, link = ROW(element)
+    """
+    xpath = etree.XPath(
+        'concat(%s)' % f", '{_SEP}', ".join(f'normalize-space(({expr})[1])' for expr in exprs),
+        smart_strings=False)
+
+    def evaluate(node):
+        return tuple(xpath(node).split(_SEP))
+    return evaluate
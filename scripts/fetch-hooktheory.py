@@ -0,0 +1,80 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import aiohttp
+
+# Item building lives with the spider templates so the spider and this script
+# stay in step; scrapy-templates/chord_progressions.py is the source of truth
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scrapy-templates'))
+from chord_progressions import build_progression_item
+
+# orjson decodes and encodes faster; fall back to plain json when it isn't installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+API_URL = 'https://www.hooktheory.com/api/v1/trends/listData?ajax=true'
+
+
+def _progressions(data, limit):
+    """Yield up to limit items from a trends payload, as HooktheorySpider.parse does"""
+    count = 0
+    for trend in data.get('trends', []):
+        if count >= limit:
+            break
+
+        item = build_progression_item(trend)
+        if item is not None:
+            yield item
+            count += 1
+
+
+async def fetch_hooktheory(limit: int = 100, output_file: str = 'public/data/hooktheory-progressions.ndjson') -> int:
+    """
+    Fetch Hooktheory chord progression trends without starting Scrapy
+    Writes the same items as the hooktheory spider, one JSON object per line
+    """
+
+    print(f"📥 Fetching chord progression trends from {API_URL}...")
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(API_URL) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+    try:
+        data = _loads(body)
+    except ValueError:
+        print("❌ Failed to parse JSON from API")
+        return 0
+
+    if 'trends' not in data:
+        print("⚠️ No trends found in response")
+        return 0
+
+    out = Path(output_file)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(out, 'wb') as f:
+        for item in _progressions(data, limit):
+            f.write(_dumps(item) + b'\n')
+            written += 1
+
+    print(f"✅ Saved {written} progressions to {out}")
+    return written
+
+if __name__ == '__main__':
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    output_file = sys.argv[2] if len(sys.argv) > 2 else 'public/data/hooktheory-progressions.ndjson'
+
+    asyncio.run(fetch_hooktheory(limit, output_file))
@@ -1,5 +1,112 @@
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from sys import intern
+
+# orjson is several times faster on big dumps; plain json keeps the script dependency-free.
+# Only the small summary is indented and key-sorted; the characters and
+# grouping files stay compact so those passes never run over the whole dataset
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _DUMP_BIG = 0
+    _DUMP_SMALL = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+    def _dumps(obj, option=_DUMP_BIG):
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _loads = json.loads
+    _DUMP_BIG = {'separators': (',', ':')}
+    _DUMP_SMALL = {'indent': 2, 'sort_keys': True}
+
+    def _dumps(obj, option=_DUMP_BIG):
+        return json.dumps(obj, ensure_ascii=False, **option).encode('utf-8')
+
+# ijson streams the input array so big crawl dumps never sit in memory whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _iter_characters(f):
+    """
+    Iterable over the items of the top-level JSON array in f
+    None when f holds anything but an array, checked before any item is read
+    """
+    if ijson is not None:
+        # Peek at the first byte and rewind, so ijson still gets the file
+        # itself and keeps its C backend's fast path
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first != b'[':
+            return None
+        f.seek(0)
+        return ijson.items(f, 'item', use_float=True)
+    raw_data = _loads(f.read())
+    if not isinstance(raw_data, list):
+        return None
+    return raw_data
+
+
+def _canonical(names, value):
+    """
+    First-seen spelling of value, matched case-insensitively
+    Keeps 'Naruto' and 'NARUTO' in one group under one interned key
+    """
+    key = value.casefold()
+    name = names.get(key)
+    if name is None:
+        name = names[key] = intern(value)
+    return name
+
+
+def _write_array(f, records):
+    """Write already-serialized records as a JSON array"""
+    f.write(b'[')
+    for i, record in enumerate(records):
+        if i:
+            f.write(b',')
+        f.write(record)
+    f.write(b']')
+
+
+def _write_groups(f, groups):
+    """Write a {key: [records]} mapping of already-serialized records"""
+    f.write(b'{')
+    for i, (key, records) in enumerate(groups.items()):
+        if i:
+            f.write(b',')
+        f.write(_dumps(str(key)) + b':')
+        _write_array(f, records)
+    f.write(b'}')
+
+
+def _write_groups_file(path, groups):
+    with open(path, 'wb') as f:
+        _write_groups(f, groups)
+
+
+@contextmanager
+def _staged(*paths):
+    """
+    Temp files to write paths to, renamed over them once the block succeeds
+    On failure they are removed, so the previous run's files stay as a set
+    """
+    temps = [path.with_name(path.name + '.tmp') for path in paths]
+    try:
+        yield temps
+    except BaseException:
+        for temp in temps:
+            temp.unlink(missing_ok=True)
+        raise
+    for temp, path in zip(temps, paths):
+        temp.replace(path)
+
 
 def process_anime_character_data(json_file_path: str, output_dir: str = 'public/data') -> dict:
     """
@@ -7,91 +114,89 @@ def process_anime_character_data(json_file_path: str, output_dir: str = 'public/
     Converts Scrapy JSON to chatbot-ready format
     """
     
-    # Create output directory
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Load JSON data
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
-    
-    if not isinstance(raw_data, list):
-        print("❌ Expected array of characters")
-        return {}
-    
-    print(f"📥 Processing {len(raw_data)} characters from MyAnimeList...")
-    
-    # Transform data
-    processed_characters = []
-    for char in raw_data:
-        processed = {
-            'id': f"mal-{char.get('id', '')}",
-            'name': char.get('name', '').strip(),
-            'source': 'myanimelist',
-            'mal_id': char.get('id', ''),
-            'url': char.get('url', ''),
-            'series': char.get('anime', '').strip() or 'Unknown',
-            'roles': char.get('roles', '').strip() or 'Main',
-            'category': char.get('query', 'fantasy'),  # fantasy, action, etc.
-            'personality_traits': [],  # Empty - MyAnimeList doesn't provide
-            'description': '',  # Would need to scrape detail page
-            'timestamp': None,
-        }
+    print(f"📥 Processing characters from {json_file_path}...")
+    
+    # Transform, write and group in one pass over the input. Each record
+    # is serialized once: the NDJSON line goes straight to disk and the
+    # same bytes are kept for the grouped files
+    total_characters = 0
+    by_series = defaultdict(list)
+    by_category = defaultdict(list)
+    series_names = {}
+    category_names = {}
+    with open(json_file_path, 'rb') as f:
+        characters = _iter_characters(f)
+        # Bail out before touching the outputs so a bad input can't
+        # truncate the files left by the previous run
+        if characters is None:
+            print("❌ Expected array of characters")
+            return {}
         
-        if processed['name']:  # Only add if name exists
-            processed_characters.append(processed)
-    
-    # Save full dataset
-    output_file = Path(output_dir) / 'myanimelist-characters.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_characters, f, indent=2, ensure_ascii=False)
-    
-    print(f"✅ Saved {len(processed_characters)} characters to {output_file}")
-    
-    # Group by series
-    by_series = {}
-    for char in processed_characters:
-        series = char['series']
-        if series not in by_series:
-            by_series[series] = []
-        by_series[series].append(char)
-    
-    series_file = Path(output_dir) / 'myanimelist-by-series.json'
-    with open(series_file, 'w', encoding='utf-8') as f:
-        json.dump(by_series, f, indent=2, ensure_ascii=False)
-    
+        # Create output directory
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        output_file = out / 'myanimelist-characters.ndjson'
+        series_file = out / 'myanimelist-by-series.json'
+        category_file = out / 'myanimelist-by-category.json'
+        summary_file = out / 'myanimelist-summary.json'
+        # Outputs replace the previous run's only once all four are written
+        with _staged(output_file, series_file, category_file, summary_file) as (
+                output_tmp, series_tmp, category_tmp, summary_tmp):
+            with open(output_tmp, 'wb') as characters_out:
+                for char in characters:
+                    name = (char.get('name') or '').strip()
+                    if not name:  # Only add if name exists
+                        continue
+                    
+                    mal_id = char.get('id') or ''
+                    processed = {
+                        'id': f"mal-{mal_id}",
+                        'name': name,
+                        'source': 'myanimelist',
+                        'mal_id': mal_id,
+                        'url': char.get('url', ''),
+                        'series': (char.get('anime') or '').strip() or 'Unknown',
+                        'roles': (char.get('roles') or '').strip() or 'Main',
+                        'category': (char.get('query', 'fantasy') or '').strip(),  # fantasy, action, etc.
+                        'personality_traits': [],  # Empty - MyAnimeList doesn't provide
+                        'description': '',  # Would need to scrape detail page
+                        'timestamp': None,
+                    }
+                    
+                    record = _dumps(processed)
+                    characters_out.write(record + b'\n')
+                    by_series[_canonical(series_names, processed['series'])].append(record)
+                    by_category[_canonical(category_names, processed['category'])].append(record)
+                    total_characters += 1
+            
+            # Create summary
+            summary = {
+                'total_characters': total_characters,
+                'unique_series': len(by_series),
+                'categories': list(by_category.keys()),
+                'series_list': list(by_series.keys()),
+                'files': {
+                    'all': 'myanimelist-characters.ndjson',
+                    'by_series': 'myanimelist-by-series.json',
+                    'by_category': 'myanimelist-by-category.json',
+                }
+            }
+            
+            # The grouping and summary files are independent, so write them in
+            # parallel; each thread releases the GIL while its writes hit the disk
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                writes = [
+                    pool.submit(_write_groups_file, series_tmp, by_series),
+                    pool.submit(_write_groups_file, category_tmp, by_category),
+                    pool.submit(summary_tmp.write_bytes, _dumps(summary, _DUMP_SMALL)),
+                ]
+                for write in writes:
+                    write.result()
+    
+    print(f"✅ Saved {total_characters} characters to {output_file}")
     print(f"✅ Saved {len(by_series)} series grouping")
-    
-    # Group by category
-    by_category = {}
-    for char in processed_characters:
-        cat = char['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(char)
-    
-    category_file = Path(output_dir) / 'myanimelist-by-category.json'
-    with open(category_file, 'w', encoding='utf-8') as f:
-        json.dump(by_category, f, indent=2, ensure_ascii=False)
-    
     print(f"✅ Saved {len(by_category)} category grouping")
     
-    # Create summary
-    summary = {
-        'total_characters': len(processed_characters),
-        'unique_series': len(by_series),
-        'categories': list(by_category.keys()),
-        'series_list': list(by_series.keys()),
-        'files': {
-            'all': 'myanimelist-characters.json',
-            'by_series': 'myanimelist-by-series.json',
-            'by_category': 'myanimelist-by-category.json',
-        }
-    }
-    
-    summary_file = Path(output_dir) / 'myanimelist-summary.json'
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
-    
     print(f"\n📊 Summary:")
     print(f"  • Total characters: {summary['total_characters']}")
     print(f"  • Unique series: {summary['unique_series']}")
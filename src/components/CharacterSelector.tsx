@@ -42,7 +42,7 @@ export function CharacterSelector({
       
       switch (source) {
         case 'myanimelist':
-          filename = 'myanimelist-characters.json';
+          filename = 'myanimelist-characters.ndjson';
           break;
         case 'anime_gf':
           filename = 'anime-gf-characters.json';
@@ -54,7 +54,13 @@ export function CharacterSelector({
       const response = await fetch(`/data/${filename}`);
       if (!response.ok) throw new Error('Failed to load characters');
 
-      let data: Character[] = await response.json();
+      // NDJSON files hold one character per line
+      let data: Character[] = filename.endsWith('.ndjson')
+        ? (await response.text())
+            .split('\n')
+            .filter(line => line.trim())
+            .map(line => JSON.parse(line))
+        : await response.json();
 
       // Filter by category if specified
       if (category) {